@@ -44,9 +44,11 @@ st.caption("Upload data · Explore · Regress")
 # Section 1: Upload
 # df and num_cols are None if no file has been uploaded yet.
 # Each section below guards against that and returns early if needed.
+# df_num is the numeric columns as one contiguous frame — the EDA sections
+# slice it constantly, and a homogeneous block makes those slices cheap.
 # ---------------------------------------------------------------------------
 st.divider()
-df, num_cols = upload.render()
+df, df_num, num_cols = upload.render()
 
 if df is None:
     st.stop()  # nothing else to show until the user uploads a file
@@ -55,17 +57,19 @@ if df is None:
 # Section 2: Univariate EDA
 # ---------------------------------------------------------------------------
 st.divider()
-univariate.render(df, num_cols)
+univariate.render(df_num, num_cols)
 
 # ---------------------------------------------------------------------------
 # Section 3: Bivariate EDA
 # Returns the selected Y so we can pre-fill the regression formula.
 # ---------------------------------------------------------------------------
 st.divider()
-selected_y = bivariate.render(df, num_cols)
+selected_y = bivariate.render(df_num, num_cols)
 
 # ---------------------------------------------------------------------------
 # Section 4: OLS Regression
+# Gets the full frame (not df_num): formulas may reference categorical
+# columns via C(), which the numeric-only view doesn't have.
 # ---------------------------------------------------------------------------
 st.divider()
 regression.render(df, num_cols, default_y=selected_y)
@@ -12,19 +12,28 @@ Why show the confidence band?
   A very wide band at the edges signals that predictions there are
   unreliable — a common source of over-confident extrapolation.
 
+Why not seaborn.regplot?
+  regplot bootstraps its confidence band (1000 OLS refits by default),
+  which dominated the cost of this section. The band for simple OLS has
+  a closed form, so we draw it directly — same picture, a fraction of
+  the work.
+
 Why Pearson r and not Spearman?
   Pearson r is the natural companion to OLS regression (it squares to R²
   in simple regression). If the scatterplot looks non-linear or has heavy
   outliers, adding Spearman would be a good extension.
 """
 
-import matplotlib.pyplot as plt
+import numpy as np
 import pandas as pd
 import scipy.stats as stats
-import seaborn as sns
 import streamlit as st
 
-from utils.plotting import ACCENT_COLOR, fig_to_streamlit
+from utils.plotting import ACCENT_COLOR, PRIMARY_COLOR, fig_to_streamlit, reusable_axes
+
+# Above this many points a scatterplot is an overplotted blob and every extra
+# point just costs rasterization time — a uniform subsample looks identical.
+MAX_SCATTER_POINTS = 5000
 
 
 def render(df: pd.DataFrame, num_cols: list[str]) -> str | None:
@@ -59,6 +68,49 @@ def render(df: pd.DataFrame, num_cols: list[str]) -> str | None:
     return y_col
 
 
+def _pearson(x: np.ndarray, y: np.ndarray) -> tuple[float, float]:
+    """
+    Pearson r with its two-sided p-value, computed directly with numpy.
+
+    scipy.stats.pearsonr derives the p-value through a Beta distribution and
+    high-precision special functions — far more machinery than an EDA label
+    needs, and noticeably slower on large n. The classic t-transform
+    t = r·sqrt((n−2)/(1−r²)) gives the same p-value for n ≥ 3.
+    """
+    n = len(x)
+    r = float(np.corrcoef(x, y)[0, 1])
+
+    if 1.0 - r * r <= 0.0:  # perfect correlation — t blows up, p is 0
+        return r, 0.0
+
+    t = r * np.sqrt((n - 2) / (1.0 - r * r))
+    p = 2.0 * stats.t.sf(abs(t), n - 2)
+    return r, float(p)
+
+
+def _trend_with_ci(ax, x: np.ndarray, y: np.ndarray) -> None:
+    """
+    Draw the OLS trend line with its analytic 95% confidence band.
+
+    For simple regression the standard error of the fitted mean at a point
+    x0 is  sqrt(s² · (1/n + (x0 − x̄)² / Σ(x − x̄)²))  where s² is the
+    residual variance — no bootstrapping required. Evaluated on a 100-point
+    grid, which is plenty for a smooth band.
+    """
+    n = len(x)
+    slope, intercept = np.polyfit(x, y, 1)
+
+    xgrid = np.linspace(x.min(), x.max(), 100)
+    yhat = slope * xgrid + intercept
+
+    resid = y - (slope * x + intercept)
+    s2 = resid @ resid / (n - 2)
+    se = np.sqrt(s2 * (1.0 / n + (xgrid - x.mean()) ** 2 / ((x - x.mean()) ** 2).sum()))
+
+    ax.fill_between(xgrid, yhat - 1.96 * se, yhat + 1.96 * se, color=ACCENT_COLOR, alpha=0.2)
+    ax.plot(xgrid, yhat, color=ACCENT_COLOR, linewidth=1.5)
+
+
 def _render_pair(df: pd.DataFrame, x_col: str, y_col: str) -> None:
     """Render correlation stat + scatterplot for one (X, Y) pair."""
 
@@ -68,7 +120,9 @@ def _render_pair(df: pd.DataFrame, x_col: str, y_col: str) -> None:
         st.warning(f"Not enough non-missing data to correlate `{x_col}` and `{y_col}`.")
         return
 
-    r, p_val = stats.pearsonr(pair[x_col], pair[y_col])
+    x = pair[x_col].to_numpy(dtype=float)
+    y = pair[y_col].to_numpy(dtype=float)
+    r, p_val = _pearson(x, y)
 
     st.subheader(f"`{x_col}` vs `{y_col}`")
     st.markdown(
@@ -77,15 +131,23 @@ def _render_pair(df: pd.DataFrame, x_col: str, y_col: str) -> None:
         f"n = {len(pair):,}"
     )
 
-    fig, ax = plt.subplots(figsize=(7, 4))
-    sns.regplot(
-        data=pair,
-        x=x_col,
-        y=y_col,
-        ax=ax,
-        scatter_kws={"alpha": 0.5, "s": 20},
-        line_kws={"color": ACCENT_COLOR, "linewidth": 1.5},
-    )
+    # Subsample for drawing only — r, the p-value and the trend line are
+    # always computed on the full data.
+    if len(pair) > MAX_SCATTER_POINTS:
+        shown = pair.sample(MAX_SCATTER_POINTS, random_state=0)
+        xs = shown[x_col].to_numpy(dtype=float)
+        ys = shown[y_col].to_numpy(dtype=float)
+        st.caption(
+            f"Scatter shows a random sample of {MAX_SCATTER_POINTS:,} "
+            f"of {len(pair):,} points."
+        )
+    else:
+        xs, ys = x, y
+
+    fig, axes = reusable_axes(1, 1, width=7, height=4)
+    ax = axes[0][0]
+    ax.scatter(xs, ys, alpha=0.5, s=20, color=PRIMARY_COLOR)
+    _trend_with_ci(ax, x, y)
     ax.set_xlabel(x_col)
     ax.set_ylabel(y_col)
     ax.set_title(f"{y_col} ~ {x_col}  (r = {r:.3f})")
@@ -25,13 +25,14 @@ Common failure points:
 """
 
 import numpy as np
-import matplotlib.pyplot as plt
 import pandas as pd
 import scipy.stats as stats
-import statsmodels.formula.api as smf
+import statsmodels.api as sm
 import streamlit as st
+from patsy import dmatrices
 
-from utils.plotting import ACCENT_COLOR, PRIMARY_COLOR, fig_to_streamlit
+from utils.data_io import df_surrogate_hash
+from utils.plotting import ACCENT_COLOR, PRIMARY_COLOR, fig_to_streamlit, reusable_axes
 
 
 def render(df: pd.DataFrame, num_cols: list[str], default_y: str | None = None) -> None:
@@ -67,11 +68,79 @@ def render(df: pd.DataFrame, num_cols: list[str], default_y: str | None = None)
     _fit_and_display(df, formula)
 
 
+# Frames are parked here so the cached fitter below can reach them without
+# Streamlit ever hashing a whole DataFrame. The key is the shared O(1)
+# surrogate from utils.data_io, which is stable across reruns (object
+# identity is not: st.cache_data hands back a fresh copy of the frame on
+# every rerun). Model results live in cache_resource, which additionally
+# skips output hashing entirely — right for stateful statsmodels objects.
+#
+# The registry is capped at the same size as the caches below: without a
+# cap it would hold a strong reference to every frame ever fitted, leaking
+# one full DataFrame per distinct upload on a long-lived server.
+_DF_REGISTRY: dict[tuple, pd.DataFrame] = {}
+_REGISTRY_MAX = 8  # keep in step with max_entries on _design/_fit
+
+
+def _df_key(df: pd.DataFrame) -> tuple:
+    """O(1) surrogate identity for a loaded DataFrame."""
+    return df_surrogate_hash(df)
+
+
+def _register_df(df: pd.DataFrame) -> tuple:
+    """
+    Park a frame for the cached fitter and return its key.
+
+    Re-inserting moves the key to the back, so the eviction below always
+    drops the least-recently used frame. Evicting a frame whose fit is
+    still cached is fine — a cache hit never touches the registry, and a
+    miss only ever happens right after this call has inserted the key.
+    """
+    key = _df_key(df)
+    _DF_REGISTRY.pop(key, None)
+    _DF_REGISTRY[key] = df
+    while len(_DF_REGISTRY) > _REGISTRY_MAX:
+        _DF_REGISTRY.pop(next(iter(_DF_REGISTRY)))
+    return key
+
+
+@st.cache_resource(max_entries=8)
+def _design(formula: str, df_key: tuple):
+    """
+    Build the Patsy design matrices once per (formula, frame).
+
+    smf.ols() re-tokenizes the formula and rebuilds y and X in Python on
+    every call — pure overhead when the formula and data haven't changed.
+    Cached separately from the fit so a future second model type (e.g.
+    robust SEs) could reuse the same matrices.
+    """
+    return dmatrices(formula, _DF_REGISTRY[df_key], return_type="dataframe")
+
+
+@st.cache_resource(max_entries=8, show_spinner="Fitting model...")
+def _fit(formula: str, df_key: tuple):
+    """
+    Fit an OLS model, cached on (formula, frame identity).
+
+    cache_resource rather than cache_data: RegressionResults is a stateful
+    object holding a reference to its model — exactly the kind of thing
+    cache_data's pickle round-trip is wasted on. Re-running the same formula
+    on the same data (an expander toggle, a rerun) returns the fit as-is.
+
+    The solve itself is a LAPACK least-squares call (already fast); going
+    through sm.OLS on the prebuilt matrices just skips Patsy's re-parse.
+    """
+    y, X = _design(formula, df_key)
+    return sm.OLS(y, X).fit()
+
+
 def _fit_and_display(df: pd.DataFrame, formula: str) -> None:
     """Fit the model and render all output tables and plots."""
 
+    key = _register_df(df)
+
     try:
-        model = smf.ols(formula=formula, data=df).fit()
+        model = _fit(formula, key)
     except Exception as exc:
         # Surface the error in the UI with context — don't just crash silently
         st.error(f"**Model failed:** {exc}")
@@ -121,15 +190,18 @@ def _show_coef_table(model) -> None:
         }
     )
 
-    def _highlight_sig(val):
-        # Green background for statistically significant p-values
-        try:
-            return "background-color: #d4edda" if float(val) < 0.05 else ""
-        except (ValueError, TypeError):
-            return ""
+    # Ensure the comparison below is numeric, once, instead of re-coercing
+    # strings cell by cell inside the highlighter.
+    coef_df["p-value"] = coef_df["p-value"].astype(float)
+
+    def _highlight_sig(col: pd.Series) -> np.ndarray:
+        # Green background for statistically significant p-values.
+        # Styler.apply gets the whole column, so this is one vectorized
+        # comparison instead of a Python function call per cell (applymap).
+        return np.where(col < 0.05, "background-color: #d4edda", "")
 
     st.dataframe(
-        coef_df.style.format("{:.4f}").applymap(_highlight_sig, subset=["p-value"]),
+        coef_df.style.format("{:.4f}").apply(_highlight_sig, subset=["p-value"]),
         use_container_width=True,
     )
 
@@ -138,15 +210,26 @@ def _show_diagnostics(model) -> None:
     """Render the Residuals vs Fitted and Q-Q plots side by side."""
     st.subheader("Diagnostics")
 
-    residuals = model.resid
-    fitted = model.fittedvalues
+    residuals = np.asarray(model.resid)
+    fitted = np.asarray(model.fittedvalues)
+
+    # Drawing every point past a few thousand only adds rasterization time
+    # to an already-overplotted cloud; a uniform subsample looks the same.
+    # Diagnostics stay honest: the subsample is random, not systematic.
+    max_points = 5000
+    if len(residuals) > max_points:
+        idx = np.random.default_rng(0).choice(len(residuals), max_points, replace=False)
+        res_plot, fit_plot = residuals[idx], fitted[idx]
+    else:
+        res_plot, fit_plot = residuals, fitted
 
-    fig, axes = plt.subplots(1, 2, figsize=(12, 4))
+    fig, axes_grid = reusable_axes(1, 2, width=12, height=4)
+    axes = axes_grid[0]
 
     # --- Residuals vs Fitted ---
     # A random scatter around the horizontal zero line is what we want.
     # Patterns (funnel shape, curve) indicate heteroscedasticity or non-linearity.
-    axes[0].scatter(fitted, residuals, alpha=0.4, s=15, color=PRIMARY_COLOR)
+    axes[0].scatter(fit_plot, res_plot, alpha=0.4, s=15, color=PRIMARY_COLOR)
     axes[0].axhline(0, color=ACCENT_COLOR, linewidth=1.2, linestyle="--")
     axes[0].set_xlabel("Fitted values")
     axes[0].set_ylabel("Residuals")
@@ -155,7 +238,19 @@ def _show_diagnostics(model) -> None:
     # --- Q-Q Plot ---
     # Points should follow the diagonal line if residuals are roughly normal.
     # Heavy tails or S-curves suggest non-normality.
-    (osm, osr), (slope, intercept, _) = stats.probplot(residuals, dist="norm")
+    # Computed directly instead of stats.probplot: all a Q-Q plot needs is
+    # sorted residuals against normal quantiles at the plotting positions
+    # (i − 0.5)/n. probplot goes through scipy's generic distribution
+    # machinery to produce the same points, several times slower.
+    osr = np.sort(residuals)
+    n = len(osr)
+    osm = stats.norm.ppf((np.arange(1, n + 1) - 0.5) / n)
+    slope, intercept = np.polyfit(osm, osr, 1)
+    if n > max_points:
+        # osm/osr are sorted, so an evenly-spaced subsample keeps the full
+        # quantile range (including both tails, where non-normality shows).
+        keep = np.linspace(0, n - 1, max_points).astype(int)
+        osm, osr = osm[keep], osr[keep]
     axes[1].scatter(osm, osr, alpha=0.4, s=15, color=PRIMARY_COLOR)
     axes[1].plot(
         osm,
@@ -19,12 +19,13 @@ Why a side-by-side histogram + boxplot?
   than either alone.
 """
 
-import matplotlib.gridspec as gridspec
-import matplotlib.pyplot as plt
+import numpy as np
 import pandas as pd
+import scipy.stats as stats
 import streamlit as st
+from matplotlib.figure import Figure
 
-from utils.plotting import PRIMARY_COLOR, fig_to_streamlit
+from utils.plotting import PRIMARY_COLOR, fig_to_streamlit, reusable_axes
 
 
 def render(df: pd.DataFrame, num_cols: list[str]) -> None:
@@ -42,58 +43,153 @@ def render(df: pd.DataFrame, num_cols: list[str]) -> None:
         default=num_cols[:1],  # pre-select first column as a sensible default
     )
 
+    if not selected:
+        return
+
+    # Summary tables first, one per variable...
     for col in selected:
         st.subheader(f"Variable: `{col}`")
-        _render_variable(df, col)
+        _render_stats(df, col)
+
+    # ...then every histogram + boxplot in ONE figure, rendered once.
+    # Rendering is per-figure (canvas setup, font warmup, the encode on
+    # Streamlit's side), so one tall N-row figure amortizes that cost over
+    # all variables instead of paying it N times.
+    st.subheader("Distributions")
+    fig_to_streamlit(_distributions_figure(df, selected))
 
 
-def _render_variable(df: pd.DataFrame, col: str) -> None:
-    """Render stats table + plots for a single variable."""
+def _render_stats(df: pd.DataFrame, col: str) -> None:
+    """Render the summary-statistics table for a single variable."""
 
     series = df[col].dropna()
-    n_missing = df[col].isna().sum()
-
-    # Build a summary table with standard + extra stats
-    desc = series.describe(percentiles=[0.05, 0.25, 0.5, 0.75, 0.95])
-    extra = pd.Series(
-        {
-            "skewness": series.skew(),
-            "kurtosis (excess)": series.kurt(),  # 0 = normal; >0 = heavy tails
-            "missing": float(n_missing),
-        }
-    )
-    summary = pd.concat([desc, extra]).rename("value").to_frame()
-    summary.index.name = "statistic"
+    n_missing = int(df[col].isna().sum())
 
-    col_left, col_right = st.columns([1, 2])
+    # Summary stats are a deterministic function of the column values, so
+    # they come from a cached helper. The raw bytes of the numpy array are
+    # a cheap, hashable cache key: on a rerun (every widget interaction)
+    # Streamlit hashes the bytes and skips the math.
+    values = series.to_numpy()
+    summary = _summary(values.tobytes(), str(values.dtype), n_missing)
 
+    col_left, _ = st.columns([1, 2])
     with col_left:
         st.dataframe(
             summary.style.format({"value": "{:.4f}"}),
             use_container_width=True,
         )
 
-    with col_right:
-        fig = _histogram_boxplot(series, col)
-        fig_to_streamlit(fig)
 
+def _distributions_figure(df: pd.DataFrame, selected: list[str]) -> Figure:
+    """Build one figure with a histogram + boxplot row per selected variable."""
+
+    fig, axes = reusable_axes(
+        len(selected),
+        2,
+        width=8,
+        height=4 * len(selected),
+        width_ratios=(3, 1),
+        wspace=0.05,
+        sharey_rows=True,
+    )
+
+    for row, col in zip(axes, selected):
+        series = df[col].dropna()
+        values = series.to_numpy()
+        counts, edges = _hist_counts(values.tobytes(), str(values.dtype))
+        _draw_histogram_boxplot(row[0], row[1], series, col, counts, edges)
+
+    return fig
 
-def _histogram_boxplot(series: pd.Series, label: str) -> plt.Figure:
-    """
-    Build a figure with a histogram (left) and boxplot (right) sharing the y-axis.
 
-    Sharing the y-axis means the boxplot whiskers align with the histogram bars,
-    making it easy to see exactly where outliers fall on the distribution.
+@st.cache_data
+def _summary(values: bytes, dtype: str, n_missing: int) -> pd.DataFrame:
+    """
+    Build the summary-statistics table for one column. Cached on the raw
+    column bytes, so reruns with the same data return instantly.
     """
-    fig = plt.figure(figsize=(8, 4))
-    gs = gridspec.GridSpec(1, 2, width_ratios=[3, 1], wspace=0.05)
+    v = np.frombuffer(values, dtype=dtype)
+
+    # Calling describe() + skew() + kurt() separately scans the column
+    # several times. scipy's describe computes count/min/max/mean/variance/
+    # skewness/kurtosis in one pass (bias=False matches pandas' corrected
+    # estimators), and one np.percentile call covers all five quantiles.
+    if v.size:
+        d = stats.describe(v, bias=False)
+        qs = np.percentile(v, [5, 25, 50, 75, 95])
+        row = {
+            "count": float(d.nobs),
+            "mean": d.mean,
+            "std": float(np.sqrt(d.variance)),
+            "min": float(d.minmax[0]),
+            "5%": qs[0],
+            "25%": qs[1],
+            "50%": qs[2],
+            "75%": qs[3],
+            "95%": qs[4],
+            "max": float(d.minmax[1]),
+            "skewness": d.skewness,
+            "kurtosis (excess)": d.kurtosis,  # 0 = normal; >0 = heavy tails
+        }
+    else:
+        # All-missing column: keep the table shape, values are undefined
+        row = dict.fromkeys(
+            ["mean", "std", "min", "5%", "25%", "50%", "75%", "95%", "max",
+             "skewness", "kurtosis (excess)"],
+            float("nan"),
+        )
+        row = {"count": 0.0, **row}
+
+    row["missing"] = float(n_missing)
+    summary = pd.Series(row).rename("value").to_frame()
+    summary.index.name = "statistic"
+    return summary
 
-    ax_hist = fig.add_subplot(gs[0])
-    ax_box = fig.add_subplot(gs[1], sharey=ax_hist)
 
-    ax_hist.hist(
-        series,
-        bins="auto",  # numpy picks a sensible bin count
+@st.cache_data
+def _hist_counts(values: bytes, dtype: str) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Compute histogram counts and bin edges for one column, cached like
+    _summary(). bins="auto" scans the data twice (it needs the IQR), so
+    skipping it on reruns is a real saving for large columns.
+
+    For large columns we also skip the data-driven bin-width estimation on
+    the first computation: Sturges' rule needs only the row count, so the
+    histogram becomes a single O(n) counting pass. Freedman–Diaconis picks
+    slightly nicer widths on odd distributions, but with this many rows the
+    shape is clear either way.
+    """
+    v = np.frombuffer(values, dtype=dtype)
+    if v.size > 100_000:
+        nbins = int(np.log2(v.size)) + 1  # Sturges' rule
+        counts, edges = np.histogram(v, bins=nbins)
+    else:
+        counts, edges = np.histogram(v, bins="auto")
+    return counts, edges
+
+
+def _draw_histogram_boxplot(
+    ax_hist,
+    ax_box,
+    series: pd.Series,
+    label: str,
+    counts: np.ndarray,
+    edges: np.ndarray,
+) -> None:
+    """
+    Draw a histogram (left) and boxplot (right) onto one row of axes.
+
+    The two axes share their y-axis, so the boxplot whiskers align with the
+    histogram bars — easy to see exactly where outliers fall on the
+    distribution.
+    """
+    # Draw the precomputed (cached) histogram as bars — identical output to
+    # ax.hist(), without re-binning the data on every rerun.
+    ax_hist.bar(
+        edges[:-1],
+        counts,
+        width=np.diff(edges),
+        align="edge",
         color=PRIMARY_COLOR,
         edgecolor="white",
         linewidth=0.5,
@@ -111,5 +207,3 @@ def _histogram_boxplot(series: pd.Series, label: str) -> plt.Figure:
     )
     ax_box.set_title("Boxplot")
     ax_box.tick_params(labelleft=False)  # y-labels already on the histogram side
-
-    return fig
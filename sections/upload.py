@@ -15,12 +15,102 @@ Why return the DataFrame instead of storing it in a global?
   makes the data flow easier to follow and debug.
 """
 
+import glob
+import hashlib
+import os
+import tempfile
+
+import pandas as pd
 import streamlit as st
 
 from utils.data_io import load_data, numeric_cols
 
+# On-disk Feather copies kept around; older ones are pruned (the temp dir
+# would otherwise accumulate one file per distinct upload, forever).
+_FEATHER_CACHE_MAX = 8
+
+
+def _content_digest(data: bytes) -> str:
+    """
+    Stable digest of an upload's raw bytes.
+
+    We use hashlib rather than Python's built-in hash() because hash() is
+    randomized per process — the digest names the on-disk cache file, so it
+    must be stable across app restarts for the cache to ever hit.
+    """
+    return hashlib.sha1(data).hexdigest()[:16]
+
+
+def _feather_cache_path(digest: str) -> str:
+    """Path of the on-disk Feather copy for a given upload digest."""
+    return os.path.join(tempfile.gettempdir(), f"statapp_{digest}.feather")
+
+
+def _prune_feather_cache() -> None:
+    """Drop the oldest Feather copies once there are more than the cap."""
+    files = sorted(
+        glob.glob(os.path.join(tempfile.gettempdir(), "statapp_*.feather")),
+        key=os.path.getmtime,
+    )
+    for stale in files[:-_FEATHER_CACHE_MAX]:
+        try:
+            os.remove(stale)
+        except OSError:
+            pass  # already gone, or not ours to delete — either way fine
+
+
+@st.cache_data(show_spinner="Loading data...", max_entries=4)
+def _read_feather_cached(path: str) -> pd.DataFrame:
+    """
+    Read a Feather copy, cached in memory on its path.
 
-def render() -> tuple[object, list[str]] | tuple[None, None]:
+    The path embeds the upload's content digest, so it is a sound cache
+    key: same path, same data. Without this layer the existence check in
+    _load_with_feather_cache would short-circuit the in-memory loader cache
+    and re-read the file from disk on every rerun.
+    """
+    return pd.read_feather(path)
+
+
+def _load_with_feather_cache(uploaded) -> pd.DataFrame:
+    """
+    Load the uploaded file, going through an on-disk Feather copy when possible.
+
+    Why Feather? CSV has to be re-parsed from text every time, while Feather
+    is Arrow's on-disk format and reads back almost zero-copy. The in-memory
+    st.cache_data entry covers reruns within a session; this copy also covers
+    new sessions (or cache evictions) for a file the server has seen before.
+    The cache is best-effort: if Feather can't represent the frame (e.g.
+    non-string column names from Excel) we just skip it.
+
+    Whatever path produced the frame, it leaves here stamped with the
+    upload's content digest in df.attrs — the cache keys downstream (see
+    utils.data_io.df_surrogate_hash) use it to tell apart two uploads
+    that happen to share shape, columns and dtypes.
+    """
+    digest = _content_digest(uploaded.getvalue())
+    path = _feather_cache_path(digest)
+
+    df = None
+    if os.path.exists(path):
+        try:
+            df = _read_feather_cached(path)
+        except Exception:
+            df = None  # corrupt/partial file — fall through and re-parse
+
+    if df is None:
+        df = load_data(uploaded)
+        try:
+            df.to_feather(path)
+            _prune_feather_cache()
+        except Exception:
+            pass
+
+    df.attrs["content_digest"] = digest
+    return df
+
+
+def render() -> tuple[object, object, list[str]] | tuple[None, None, None]:
     """
     Render the upload section.
 
@@ -28,6 +118,11 @@ def render() -> tuple[object, list[str]] | tuple[None, None]:
     -------
     df : pd.DataFrame | None
         The loaded data, or None if no file has been uploaded yet.
+    df_num : pd.DataFrame | None
+        Numeric columns only, as one contiguous block. The EDA sections
+        slice this frame over and over (df[col], df[[x, y]].dropna()), and
+        a homogeneous numeric frame keeps those on pandas' fast single-block
+        path instead of dispatching across mixed-dtype blocks each time.
     num_cols : list[str] | None
         Names of numeric columns, or None if no data loaded.
     """
@@ -41,10 +136,10 @@ def render() -> tuple[object, list[str]] | tuple[None, None]:
 
     if uploaded is None:
         st.info("Upload a file above to get started.")
-        return None, None
+        return None, None, None
 
     # Load data — errors inside load_data() call st.stop() themselves
-    df = load_data(uploaded)
+    df = _load_with_feather_cache(uploaded)
 
     st.success(f"Loaded **{df.shape[0]:,} rows × {df.shape[1]} columns**")
 
@@ -56,4 +151,6 @@ def render() -> tuple[object, list[str]] | tuple[None, None]:
         st.error("No numeric columns found. StatApp needs at least one numeric column.")
         st.stop()
 
-    return df, cols
+    df_num = df[cols].reset_index(drop=True)
+
+    return df, df_num, cols
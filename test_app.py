@@ -0,0 +1,255 @@
+"""
+test_app.py
+-----------
+Unit + integration tests for StatApp (pytest).
+
+These run the pure helpers directly, without a browser or a Streamlit
+server: Streamlit's cache decorators work in "bare mode" (they log a
+warning and use an in-process cache), so the functions behave exactly as
+they do inside the app.
+
+Layout follows the app's sections:
+  - data loading (utils.data_io / sections.upload)
+  - univariate stats (sections.univariate)
+  - bivariate stats (sections.bivariate)
+  - regression (sections.regression)
+  - one end-to-end flow: upload CSV -> run OLS -> check the output
+"""
+
+import io
+import tempfile
+import warnings
+
+import numpy as np
+import pandas as pd
+import pytest
+import scipy.stats as stats
+
+warnings.filterwarnings("ignore")
+
+from sections.bivariate import _pearson
+from sections.regression import _fit, _register_df
+from sections.univariate import _hist_counts, _summary
+from sections.upload import _load_with_feather_cache
+from utils.data_io import _downcast, df_surrogate_hash, load_data, numeric_cols
+
+
+class FakeUpload:
+    """Stands in for Streamlit's UploadedFile: just a name and raw bytes."""
+
+    def __init__(self, name: str, data: bytes):
+        self.name = name
+        self._data = data
+
+    def getvalue(self) -> bytes:
+        return self._data
+
+
+# ---------------------------------------------------------------------------
+# Data loading
+# ---------------------------------------------------------------------------
+
+def test_load_csv_utf8():
+    df = load_data(FakeUpload("data.csv", b"a,b\n1,2.5\n3,4.5\n"))
+    assert df.shape == (2, 2)
+    assert df["a"].tolist() == [1, 3]
+    assert df["b"].tolist() == [2.5, 4.5]
+
+
+def test_load_csv_latin1_fallback():
+    # Old-Excel exports are often latin-1; the loader must not garble them
+    raw = "name,n\ncafé,1\n".encode("latin-1")
+    df = load_data(FakeUpload("data.csv", raw))
+    assert df.loc[0, "name"] == "café"
+
+
+def test_load_xlsx():
+    buf = io.BytesIO()
+    pd.DataFrame({"a": [1, 2], "b": [3.0, 4.0]}).to_excel(buf, index=False)
+    df = load_data(FakeUpload("data.xlsx", buf.getvalue()))
+    assert df["a"].tolist() == [1, 2]
+
+
+def test_downcast_shrinks_dtypes():
+    df = pd.DataFrame(
+        {
+            "small_int": np.array([1, 2, 100, 4, 5, 6], dtype="int64"),
+            "flt": np.array([0.5, 1.5, 2.5, 3.5, 4.5, 5.5], dtype="float64"),
+            "grp": ["a", "a", "b", "b", "a", "b"],  # low cardinality -> Categorical
+            "uid": ["u1", "u2", "u3", "u4", "u5", "u6"],  # unique -> left alone
+        }
+    )
+    out = _downcast(df)
+    assert out["small_int"].dtype == np.int8
+    assert out["flt"].dtype == np.float32
+    assert isinstance(out["grp"].dtype, pd.CategoricalDtype)
+    assert not isinstance(out["uid"].dtype, pd.CategoricalDtype)
+    # values must survive the shrink
+    assert out["small_int"].tolist() == [1, 2, 100, 4, 5, 6]
+    assert out["flt"].tolist() == [0.5, 1.5, 2.5, 3.5, 4.5, 5.5]
+
+
+def test_numeric_cols_matches_select_dtypes():
+    df = pd.DataFrame(
+        {
+            "i": np.arange(3, dtype="int16"),
+            "f": np.ones(3, dtype="float32"),
+            "b": [True, False, True],
+            "s": ["x", "y", "z"],
+            "d": pd.to_datetime(["2020-01-01"] * 3),
+        }
+    )
+    assert numeric_cols(df) == df.select_dtypes(include="number").columns.tolist()
+    assert numeric_cols(df) == ["i", "f"]
+
+
+def test_surrogate_hash_distinguishes_same_shape_frames():
+    # Regression guard: two uploads with identical schema but different
+    # values must NOT share a cache key, or the model cache serves stale fits
+    a = pd.DataFrame({"x": [1.0, 2.0, 3.0]})
+    b = pd.DataFrame({"x": [1.0, 2.0, 4.0]})
+    assert df_surrogate_hash(a) != df_surrogate_hash(b)
+    assert df_surrogate_hash(a) == df_surrogate_hash(a.copy())
+
+
+def test_surrogate_hash_prefers_upload_digest():
+    df = pd.DataFrame({"x": [1.0]})
+    df.attrs["content_digest"] = "deadbeef"
+    assert "deadbeef" in df_surrogate_hash(df)
+
+
+def test_feather_cache_roundtrip(tmp_path, monkeypatch):
+    monkeypatch.setattr(tempfile, "gettempdir", lambda: str(tmp_path))
+    upload = FakeUpload("data.csv", b"x,y\n1,2\n3,4\n")
+    first = _load_with_feather_cache(upload)   # parses, writes the copy
+    second = _load_with_feather_cache(upload)  # served from the copy
+    assert second.equals(first)
+    assert first.attrs["content_digest"] == second.attrs["content_digest"]
+    assert list(tmp_path.glob("statapp_*.feather"))
+
+
+# ---------------------------------------------------------------------------
+# Univariate
+# ---------------------------------------------------------------------------
+
+def test_summary_matches_pandas():
+    v = np.random.default_rng(0).gamma(2, size=500)
+    got = _summary(v.tobytes(), str(v.dtype), n_missing=7)["value"]
+    ref = pd.Series(v)
+    desc = ref.describe(percentiles=[0.05, 0.25, 0.5, 0.75, 0.95])
+    for stat in desc.index:
+        assert got[stat] == pytest.approx(desc[stat])
+    assert got["skewness"] == pytest.approx(ref.skew())
+    assert got["kurtosis (excess)"] == pytest.approx(ref.kurt())
+    assert got["missing"] == 7.0
+
+
+def test_summary_all_missing_column():
+    empty = np.array([], dtype="float64")
+    got = _summary(empty.tobytes(), "float64", n_missing=10)["value"]
+    assert got["count"] == 0.0
+    assert got["missing"] == 10.0
+    assert np.isnan(got["mean"])
+
+
+def test_hist_counts_cover_all_values():
+    v = np.random.default_rng(1).normal(size=1_000)
+    counts, edges = _hist_counts(v.tobytes(), str(v.dtype))
+    assert counts.sum() == len(v)
+    assert len(edges) == len(counts) + 1
+    assert edges[0] == pytest.approx(v.min())
+    assert edges[-1] == pytest.approx(v.max())
+
+
+def test_hist_counts_large_column_uses_fixed_bins():
+    # Above the cutoff the bin count comes from Sturges' rule, not the data
+    v = np.random.default_rng(2).normal(size=200_000)
+    counts, _ = _hist_counts(v.tobytes(), str(v.dtype))
+    assert len(counts) == int(np.log2(len(v))) + 1
+    assert counts.sum() == len(v)
+
+
+# ---------------------------------------------------------------------------
+# Bivariate
+# ---------------------------------------------------------------------------
+
+def test_pearson_matches_scipy():
+    rng = np.random.default_rng(3)
+    x = rng.normal(size=200)
+    y = 0.4 * x + rng.normal(size=200)
+    r, p = _pearson(x, y)
+    r_ref, p_ref = stats.pearsonr(x, y)
+    assert r == pytest.approx(r_ref)
+    assert p == pytest.approx(p_ref)
+
+
+def test_pearson_perfect_correlation():
+    # r may come out as 1 - epsilon in floating point; either way the
+    # p-value must collapse to (numerically) zero instead of blowing up
+    x = np.arange(10.0)
+    for target in (2 * x, -x):
+        r, p = _pearson(x, target)
+        assert abs(r) == pytest.approx(1.0)
+        assert p == pytest.approx(0.0, abs=1e-12)
+
+
+# ---------------------------------------------------------------------------
+# Regression
+# ---------------------------------------------------------------------------
+
+def test_fit_matches_formula_api():
+    import statsmodels.formula.api as smf
+
+    rng = np.random.default_rng(4)
+    df = pd.DataFrame(
+        {"x": rng.normal(size=300), "g": np.where(rng.random(300) > 0.5, "a", "b")}
+    )
+    df["y"] = 2 * df["x"] + (df["g"] == "a") + rng.normal(size=300)
+
+    model = _fit("y ~ x + C(g)", _register_df(df))
+    ref = smf.ols("y ~ x + C(g)", data=df).fit()
+    assert np.allclose(model.params.values, ref.params.values)
+    assert model.rsquared == pytest.approx(ref.rsquared)
+
+
+def test_fit_is_cached_per_data_not_just_shape():
+    rng = np.random.default_rng(5)
+    df1 = pd.DataFrame({"x": rng.normal(size=100)})
+    df1["y"] = 1.0 * df1["x"]
+    df2 = pd.DataFrame({"x": df1["x"]})
+    df2["y"] = 3.0 * df2["x"]  # same shape and schema, different data
+
+    m1 = _fit("y ~ x", _register_df(df1))
+    m1_again = _fit("y ~ x", _register_df(df1))
+    m2 = _fit("y ~ x", _register_df(df2))
+
+    assert m1 is m1_again  # cache hit for identical data
+    assert m1 is not m2    # re-uploaded edit must NOT reuse the old fit
+    assert m1.params["x"] == pytest.approx(1.0)
+    assert m2.params["x"] == pytest.approx(3.0)
+
+
+# ---------------------------------------------------------------------------
+# Integration: upload CSV -> run OLS -> check output
+# ---------------------------------------------------------------------------
+
+def test_full_flow_upload_to_ols(tmp_path, monkeypatch):
+    monkeypatch.setattr(tempfile, "gettempdir", lambda: str(tmp_path))
+
+    # Build a CSV with a known linear relationship: y = 3x + 5 + noise
+    rng = np.random.default_rng(6)
+    x = rng.normal(size=2_000)
+    y = 3 * x + 5 + rng.normal(scale=0.1, size=2_000)
+    csv = "x,y\n" + "".join(f"{xi:.6f},{yi:.6f}\n" for xi, yi in zip(x, y))
+
+    df = _load_with_feather_cache(FakeUpload("flow.csv", csv.encode()))
+    cols = numeric_cols(df)
+    assert cols == ["x", "y"]
+
+    df_num = df[cols].reset_index(drop=True)
+    assert all(dt.kind == "f" for dt in df_num.dtypes)
+
+    model = _fit("y ~ x", _register_df(df))
+    assert model.params["x"] == pytest.approx(3.0, abs=0.05)
+    assert model.params["Intercept"] == pytest.approx(5.0, abs=0.05)
+    assert model.rsquared > 0.99
@@ -3,17 +3,36 @@ utils/plotting.py
 -----------------
 Shared plotting utilities.
 
-Why render to a buffer instead of saving to disk?
-  Streamlit can display images from an in-memory BytesIO buffer directly.
-  Saving to disk would require managing temporary files and cleaning them up —
-  especially tricky inside Docker where the filesystem may be read-only or
-  epehemeral. In-memory is simpler and more portable.
+Why st.pyplot instead of savefig-to-PNG?
+  We used to render every figure to an in-memory PNG at 120 dpi and show it
+  with st.image(). The PNG encode (zlib compression) costs tens of ms per
+  figure — pure CPU work repeated on every rerun. st.pyplot() hands the
+  figure to Streamlit's native matplotlib renderer, skipping the explicit
+  encode step, and handles sizing via the container width.
+
+Why reuse figures?
+  Creating a Figure allocates a canvas, renderer and font machinery — for
+  our small plots that setup dominates the actual drawing. We keep one
+  figure per layout and clear its axes between uses instead of building a
+  fresh figure for every variable on every rerun. The cache lives in
+  st.session_state, NOT at module level: matplotlib figures are not
+  thread-safe, and a module-level cache would be shared by every session
+  (each running in its own thread) — two concurrent reruns would clear and
+  draw on the same axes at once. Per-session figures keep each figure on
+  its own session's script thread.
 """
 
-import io
+import matplotlib
+
+# Force the non-interactive Agg backend before pyplot is imported.
+# Without this matplotlib probes for a GUI backend at import time; inside
+# a server (or Docker) there is none, and the probe itself costs time.
+matplotlib.use("Agg")
 
 import matplotlib.pyplot as plt
+import numpy as np
 import streamlit as st
+from matplotlib.figure import Figure
 
 
 # Global style applied to every figure in the app.
@@ -35,16 +54,87 @@ PRIMARY_COLOR = "steelblue"
 ACCENT_COLOR = "crimson"
 
 
-def fig_to_streamlit(fig: plt.Figure) -> None:
+# Layouts per session worth keeping around; past this the oldest figure is
+# dropped (it garbage-collects cleanly — see _build_fig).
+_FIG_CACHE_MAX = 8
+
+
+def _build_fig(
+    nrows: int,
+    ncols: int,
+    width: float,
+    height: float,
+    width_ratios: tuple | None,
+    wspace: float | None,
+    sharey_rows: bool,
+) -> tuple[Figure, np.ndarray]:
+    """
+    Create the figure + axes grid for a given layout.
+
+    We build a Figure directly rather than via plt.subplots() so the figure
+    is not registered with pyplot's global state — figures evicted from the
+    session cache can then be garbage-collected normally.
+    """
+    gridspec_kw = {}
+    if width_ratios is not None:
+        gridspec_kw["width_ratios"] = list(width_ratios)
+    if wspace is not None:
+        gridspec_kw["wspace"] = wspace
+
+    fig = Figure(figsize=(width, height))
+    axes = fig.subplots(nrows, ncols, gridspec_kw=gridspec_kw or None, squeeze=False)
+
+    if sharey_rows:
+        # Share y within each row (e.g. histogram + boxplot pairs).
+        # Sharing survives ax.clear(), so this only needs doing once.
+        for row in axes:
+            for ax in row[1:]:
+                ax.sharey(row[0])
+
+    return fig, axes
+
+
+def reusable_axes(
+    nrows: int = 1,
+    ncols: int = 1,
+    width: float = 7.0,
+    height: float = 4.0,
+    width_ratios: tuple | None = None,
+    wspace: float | None = None,
+    sharey_rows: bool = False,
+) -> tuple[Figure, np.ndarray]:
+    """
+    Return this session's cached figure for the given layout and its
+    (nrows × ncols) axes array, with every axis cleared and ready to draw.
+
+    Safe to call repeatedly within one script run: fig_to_streamlit()
+    renders the figure to the page immediately, so the next caller can
+    clear and redraw the same figure without affecting earlier plots.
+    Sessions never share figures (see module docstring), so concurrent
+    reruns in other sessions can't draw over ours.
+    """
+    cache = st.session_state.setdefault("_statapp_fig_cache", {})
+    key = (nrows, ncols, width, height, width_ratios, wspace, sharey_rows)
+
+    if key not in cache:
+        cache[key] = _build_fig(*key)
+        while len(cache) > _FIG_CACHE_MAX:
+            cache.pop(next(iter(cache)))  # drop the oldest layout
+
+    fig, axes = cache[key]
+    for row in axes:
+        for ax in row:
+            ax.clear()
+    return fig, axes
+
+
+def fig_to_streamlit(fig: Figure) -> None:
     """
-    Render a matplotlib Figure into the Streamlit UI, then close it.
+    Render a matplotlib Figure into the Streamlit UI.
 
-    Closing the figure after rendering is important: matplotlib keeps
-    figures in memory until explicitly closed. In a long session with
-    many variables, unclosed figures would slowly leak memory.
+    Figures from reusable_axes() are deliberately NOT closed or cleared
+    here — they are cached and reused, which is the whole point. Clearing
+    would also destroy the axes (and their y-sharing) that the cache
+    hands back on the next call.
     """
-    buf = io.BytesIO()
-    fig.savefig(buf, format="png", bbox_inches="tight", dpi=120)
-    buf.seek(0)
-    st.image(buf)
-    plt.close(fig)  # free memory — do not skip this
+    st.pyplot(fig, clear_figure=False, use_container_width=True)